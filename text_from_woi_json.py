@@ -29,65 +29,43 @@ USAGE EXAMPLES (WITH LINUX BASH):
     ※ ↑ The input JSON is first loaded from the clipboard (provided you first copied it to the clipboard), then is passed as the STDARG input of the program.
 """
 
-import sys, os, json, re
+import sys
+from functools import lru_cache
+
+try:
+  from orjson import loads as json_loads
+except ImportError:
+  from json import loads as json_loads
+
+SUBSCRIPT_FROM_DIGIT = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
 
 def entrypoint(self_path, woi_json):
-  assert(isinstance(woi_json, str))
-  t = ""
-  for e in data_from_woi_data(json.loads(woi_json)):
-    t += (e["language"] + "|" + textify(e["text_chunks"]) + "‖")
-  if len(t) > 0:
-    t = t[:-1]
-  sys.stdout.write(f"{t}\n")
+  t = "‖".join(
+    language + "|" + textify(strings, indices)
+    for language, strings, indices in data_from_woi_data(json_loads(woi_json))
+  )
+  sys.stdout.buffer.write(t.encode("utf-8") + b"\n")
   return
 
-def textify(text_chunks :dict):
+def textify(strings :list, indices :list):
   f = lambda n: "ₓ" if n is None else subscript_positional_notation(n)
-  t = ""
-  for e in text_chunks:
-    t += (e["string"] + f(e["index"]))
-  return t  
+  return "".join(c + f(i) for c, i in zip(strings, indices))
 
 def data_from_woi_data(woi_data):
-  woi_sentences = woi_data["sentences"]
+  # Yields a (language, chunk strings, chunk indices) triple for each sentence.
   woi_equivalencies = woi_data["equivalency"]
-  d = []
-  for si, s in enumerate(woi_sentences):
-    language, chunks = s
-    d.append({
-      "language": language,
-      "text_chunks": chunks_from_woi_data(chunks, woi_equivalencies, si)
-    })
-  return d
-
-def chunks_from_woi_data(woi_chunks, woi_equivalencies, si):
-  return [
-     {
-       "string": c,
-       "index": index_from_woi_data(ci, si, woi_equivalencies)
-     } for ci, c in enumerate(woi_chunks)
-  ]
-
-def index_from_woi_data(ci, si, woi_equivalencies):
+  # Maps each (sentence index, chunk index) pair to the index of its equivalency.
+  lookup = {}
   for eqi, eql in enumerate(woi_equivalencies):
-    if ci in eql[si]:
-      return eqi
-  return None
+    for si, lst in enumerate(eql):
+      for ci in lst:
+        lookup.setdefault((si, ci), eqi)
+  for si, (language, chunks) in enumerate(woi_data["sentences"]):
+    yield language, chunks, [lookup.get((si, ci)) for ci in range(len(chunks))]
 
+@lru_cache(maxsize = 1024)
 def subscript_positional_notation(number):
-  return integer_positional_notation(number, "₀₁₂₃₄₅₆₇₈₉")
-
-def integer_positional_notation(number, digits):
-    # ⟦digits⟧ is a string or a sequence of all the digits used for encoding the number in positional notation; the number of digits is the target radix in which the number is to be encoded.
-    radix = int(len(digits))
-    n = int(number)
-    if n == 0:
-        return digits[0]
-    s = ""
-    while (n > 0):
-        s = digits[n % radix] + s
-        n //= radix
-    return s
+  return str(int(number)).translate(SUBSCRIPT_FROM_DIGIT)
 
 
 # === ENTRY POINT === #
@@ -32,98 +32,90 @@ USAGE EXAMPLES (WITH LINUX BASH):
    ※ ↑ The output JSON will be written to the clipboard.
 """
 
-import sys, os, json, re
+import sys, re
+from functools import lru_cache
+
+try:
+  import orjson
+  # orjson output is compact and non-ASCII-escaped by default, and already UTF-8 encoded.
+  json_bytes_from = orjson.dumps
+except ImportError:
+  import json
+  json_bytes_from = lambda o: json.dumps(
+    o, separators = (',', ':'), ensure_ascii = False).encode("utf-8")
+
+SUBSCRIPT_FROM_DIGIT = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+DIGIT_FROM_SUBSCRIPT = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+
+SUBSCRIPT_CHARS = frozenset("₀₁₂₃₄₅₆₇₈₉ₓ")
+
+DOUBLE_PIPE_RE = re.compile(r"\|\|")
+EMPTY_BRACES_RE = re.compile(r"\{\}")
+NUMBER_IN_BRACES_RE = re.compile(r"\{([0-9]+)\}")
 
 def entrypoint(self_path :str, text :str):
-  assert(isinstance(text, str))
   data = []
   text = with_ascii_compatibility_normalized(text)
   for e in text.split("‖"):
     r = e.split("|")
-    data.append({"language": r[0], "text_chunks": parse(r[1])})
-  sys.stdout.write(json.dumps(
-    woi_data_from(data),
-    separators = (',', ':'),
-    ensure_ascii = False)
-    + '\n'
-  )
+    strings, indices = parse(r[1])
+    data.append({"language": r[0], "strings": strings, "indices": indices})
+  sys.stdout.buffer.write(json_bytes_from(woi_data_from(data)) + b"\n")
   return
 
 def with_ascii_compatibility_normalized(s :str):
-  def f(s):
-    r = ""
-    for ch in s:
-      if ch in "{}":
-        r += ch
-      else:
-        r += "₀₁₂₃₄₅₆₇₈₉"[int(ch)]
-    return r
-  s = re.sub("\|\|", "‖", s)
-  s = re.sub("{}", "ₓ", s)
-  for m in re.finditer("{[0-9]+}", s):
-    s = s[:m.start()] + f(m.group(0)) + s[m.end():]
-  s = re.sub("{([₀₁₂₃₄₅₆₇₈₉]+)}", "\\1", s)
+  f = lambda m: m.group(1).translate(SUBSCRIPT_FROM_DIGIT)
+  s = DOUBLE_PIPE_RE.sub("‖", s)
+  s = EMPTY_BRACES_RE.sub("ₓ", s)
+  s = NUMBER_IN_BRACES_RE.sub(f, s)
   return s
 
+@lru_cache(maxsize = 4096)
 def parse(s :str):
-  lst = re.split(r"([₀₁₂₃₄₅₆₇₈₉ₓ]+)", s)
-  if len(lst) > 0 and lst[-1] == "":
-    lst = lst[0:-1]
-  text_chunks = []
-  l = len(lst)
-  i = 0
-  while i < l:
-    nxt = i + 1
-    if nxt >= l or lst[nxt] == "ₓ":
-      idx = None
-    else:
-      idx = integer_from_subscript_positional_notation(lst[nxt])
-    text_chunks.append({"string": lst[i], "index": idx})
-    i += 2
-  return text_chunks
+  # Results are cached, hence returned as tuples so that they cannot be mutated.
+  if SUBSCRIPT_CHARS.isdisjoint(s):
+    # A sentence without any index is a single unindexed chunk.
+    return ((s,), (None,)) if len(s) > 0 else ((), ())
+  f = lambda t: None if t == "ₓ" else integer_from_subscript_positional_notation(t)
+  strings = []
+  indices = []
+  chunk_start = 0
+  index_start = None
+  for i, ch in enumerate(s):
+    if ch in SUBSCRIPT_CHARS:
+      if index_start is None:
+        index_start = i
+    elif index_start is not None:
+      strings.append(s[chunk_start:index_start])
+      indices.append(f(s[index_start:i]))
+      chunk_start = i
+      index_start = None
+  if index_start is not None:
+    strings.append(s[chunk_start:index_start])
+    indices.append(f(s[index_start:]))
+  elif chunk_start < len(s):
+    strings.append(s[chunk_start:])
+    indices.append(None)
+  return tuple(strings), tuple(indices)
 
 def woi_data_from(data :list):
-  f = lambda x: [e["string"] for e in x]
-  woi_sentences = [[e["language"], f(e["text_chunks"])] for e in data]
-  woi_equivalencies = []
-  index = 1
-  while True:
-    eq = []
-    was_index_found = False
-    for e in data:
-      was_index_found_in_e = False
-      for i, x in enumerate(e["text_chunks"]):
-        if x["index"] == index:
-          if not was_index_found_in_e:
-            eq.append([i])
-          else:
-            eq[-1] += [i]
-          was_index_found_in_e = True
-          was_index_found = True
-      if not was_index_found_in_e:
-        eq.append([])
-    woi_equivalencies.append(eq)
-    if not was_index_found:
-      break
-    index += 1
+  woi_sentences = []
+  # Maps each index to its equivalency, i.e. the list of chunk positions bearing that index in each sentence.
+  empty_eq = lambda: [[] for _ in data]
+  buckets = {}
+  for si, e in enumerate(data):
+    woi_sentences.append([e["language"], e["strings"]])
+    for ci, idx in enumerate(e["indices"]):
+      if idx is not None and idx > 0:
+        buckets.setdefault(idx, empty_eq())[si].append(ci)
+  max_index = max(buckets, default = 0)
+  woi_equivalencies = [
+    buckets.get(i) or empty_eq() for i in range(1, max_index + 1)
+  ] + [empty_eq()]
   return {"sentences": woi_sentences, "equivalency": woi_equivalencies}
 
 def integer_from_subscript_positional_notation(positional_notation):
-  return integer_from_positional_notation(positional_notation, "₀₁₂₃₄₅₆₇₈₉")
-
-def integer_from_positional_notation(positional_notation, digits):
-    radix = int(len(digits))
-    n = 0
-    i = len(positional_notation) - 1
-    magnitude = 0
-    while (i >= 0):
-      ## if positional_notation[i] not in digits:
-      ##   print(f"⚠ integer_from_positional_notation: ⟪{positional_notation[i]}⟫ ∉ {str(digits)}")
-      v = digits.index(positional_notation[i])
-      n += v * pow(radix, magnitude)
-      i -= 1
-      magnitude += 1
-    return n
+  return int(positional_notation.translate(DIGIT_FROM_SUBSCRIPT))
 
 
 # === ENTRY POINT === #